@@ -3,42 +3,64 @@
 TiRex Weights Diagnostic - Check if weights are accessible
 """
 
+import argparse
 import os
-from pathlib import Path
+import stat
 
-def check_weights():
+try:
+    from tirex.offline import DEFAULT_WEIGHTS_PATH
+except Exception:
+    # Importing tirex also imports torch, which can fail in many ways (missing package, broken CUDA libs).
+    # Keep the path checks working regardless; the import failure is reported in check 3
+    DEFAULT_WEIGHTS_PATH = os.path.expanduser("~/.cache/tirex/weights")
+
+
+def _stat(path):
+    """Return os.stat result for path, or None if it does not exist."""
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def check_weights(full: bool = False):
     print("=" * 60)
     print("TiRex Weights Diagnostic")
     print("=" * 60)
     
     # Check 1: Default location
-    default_weights = Path.home() / ".cache" / "tirex" / "weights" / "model.ckpt"
+    default_weights = os.path.join(DEFAULT_WEIGHTS_PATH, "model.ckpt")
+    default_st = _stat(default_weights)
+    ckpt_path = default_weights if default_st is not None else None
     print(f"\n1. Default weights location:")
     print(f"   Path: {default_weights}")
-    print(f"   Exists: {default_weights.exists()}")
-    if default_weights.exists():
-        size_gb = default_weights.stat().st_size / (1024**3)
+    print(f"   Exists: {default_st is not None}")
+    if default_st is not None:
+        size_gb = default_st.st_size / (1024**3)
         print(f"   Size: {size_gb:.2f} GB")
     
     # Check 2: Environment variable
     env_path = os.getenv("TIREX_WEIGHTS_PATH")
+    env_st = None
     print(f"\n2. Environment variable (TIREX_WEIGHTS_PATH):")
     print(f"   Set: {env_path is not None}")
     if env_path:
-        env_path = Path(env_path)
         print(f"   Path: {env_path}")
         
         # Check if directory or file
-        if env_path.is_dir():
-            ckpt = env_path / "model.ckpt"
+        env_st = _stat(env_path)
+        if env_st is not None and stat.S_ISDIR(env_st.st_mode):
+            ckpt_st = _stat(os.path.join(env_path, "model.ckpt"))
             print(f"   Type: Directory")
-            print(f"   Contains model.ckpt: {ckpt.exists()}")
-            if ckpt.exists():
-                size_gb = ckpt.stat().st_size / (1024**3)
+            print(f"   Contains model.ckpt: {ckpt_st is not None}")
+            if ckpt_st is not None:
+                ckpt_path = os.path.join(env_path, "model.ckpt")
+                size_gb = ckpt_st.st_size / (1024**3)
                 print(f"   File size: {size_gb:.2f} GB")
-        elif env_path.is_file():
+        elif env_st is not None and stat.S_ISREG(env_st.st_mode):
             print(f"   Type: File")
-            size_gb = env_path.stat().st_size / (1024**3)
+            ckpt_path = env_path
+            size_gb = env_st.st_size / (1024**3)
             print(f"   File size: {size_gb:.2f} GB")
         else:
             print(f"   Status: Path does not exist!")
@@ -47,28 +69,77 @@ def check_weights():
     print(f"\n3. TiRex import:")
     try:
         from tirex import load_model, setup_offline_env
+        from tirex.offline import verify_ckpt
         print(f"   Status: ✓ Successfully imported")
-    except ImportError as e:
+    except Exception as e:
         print(f"   Status: ✗ Import failed: {e}")
         return False
     
-    # Check 4: Try loading model
-    print(f"\n4. Model loading:")
-    try:
-        if default_weights.exists() or env_path:
-            model = load_model("NX-AI/TiRex")
-            print(f"   Status: ✓ Model loaded successfully!")
-            return True
-        else:
-            print(f"   Status: ⚠️  No weights found")
-            print(f"   Action: Copy model.ckpt to ~/.cache/tirex/weights/")
+    # Later checks are numbered as they run, since the integrity check is optional
+    step = 3
+
+    # Check: Verify checkpoint integrity (opt-in, reads the whole file)
+    if os.getenv("TIREX_VERIFY_CKPT", "False").lower() in ("true", "1", "t") and ckpt_path is not None:
+        step += 1
+        print(f"\n{step}. Checkpoint integrity (TIREX_VERIFY_CKPT):")
+        print(f"   Path: {ckpt_path}")
+        try:
+            if verify_ckpt(ckpt_path):
+                print(f"   Status: ✓ SHA-256 matches")
+            else:
+                print(f"   Status: ✗ SHA-256 mismatch, checkpoint is corrupted")
+                print(f"   Action: Re-run setup_offline_weights.py")
+                return False
+        except FileNotFoundError:
+            print(f"   Status: ⚠️  No {ckpt_path}.sha256 found, skipping")
+        except ValueError as e:
+            print(f"   Status: ✗ {e}")
+            print(f"   Action: Re-run setup_offline_weights.py")
             return False
+
+    # Check: Locate weights without loading them (no network, no deserialization)
+    step += 1
+    print(f"\n{step}. Weights lookup:")
+    if ckpt_path is None:
+        from huggingface_hub import try_to_load_from_cache
+
+        if env_st is not None and stat.S_ISDIR(env_st.st_mode):
+            cache_dir = env_path
+        else:
+            cache_dir = os.path.dirname(default_weights)
+        hit = try_to_load_from_cache("NX-AI/TiRex", "model.ckpt", cache_dir=cache_dir)
+        if isinstance(hit, str):
+            ckpt_path = hit
+    if ckpt_path is None:
+        print(f"   Status: ⚠️  No weights found")
+        print(f"   Action: Copy model.ckpt to ~/.cache/tirex/weights/")
+        return False
+    print(f"   Status: ✓ Found {ckpt_path}")
+    if not full:
+        print(f"   Note: Run with --full to also load the model")
+        return True
+
+    # Check: Try loading model
+    step += 1
+    print(f"\n{step}. Model loading:")
+    try:
+        model = load_model("NX-AI/TiRex")
+        print(f"   Status: ✓ Model loaded successfully!")
+        return True
     except Exception as e:
         print(f"   Status: ✗ Failed to load: {e}")
         return False
 
 if __name__ == "__main__":
-    success = check_weights()
+    parser = argparse.ArgumentParser(description="Check if TiRex weights are accessible")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Also load the model to verify the checkpoint deserializes",
+    )
+    args = parser.parse_args()
+
+    success = check_weights(full=args.full)
     
     print("\n" + "=" * 60)
     if success:
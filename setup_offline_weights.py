@@ -25,17 +25,100 @@ Examples:
 """
 
 import argparse
+import importlib.util
+import inspect
 import os
+import re
+import shutil
 import sys
 from pathlib import Path
 
+# huggingface_hub reads this flag at import time, so it must be set before the import below.
+# Only opt in when hf_transfer is installed, otherwise hf_hub_download refuses to run.
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
 try:
-    from huggingface_hub import hf_hub_download
+    from huggingface_hub import constants as hf_constants, get_hf_file_metadata, hf_hub_download, hf_hub_url
 except ImportError:
     print("Error: huggingface_hub is not installed.")
     print("Install it with: pip install huggingface-hub")
+    print("For faster downloads also install: pip install hf_transfer")
     sys.exit(1)
 
+try:
+    from tirex.offline import DEFAULT_WEIGHTS_PATH, ckpt_sha256
+except Exception:
+    # This script only needs huggingface_hub, so it also runs without TiRex (or a working torch) installed
+    DEFAULT_WEIGHTS_PATH = os.path.expanduser("~/.cache/tirex/weights")
+    ckpt_sha256 = None
+
+
+def _link_checkpoint(src: str, dst: str):
+    """
+    Place the checkpoint at dst without copying its bytes where possible.
+
+    Tries a hardlink first, then a symlink, and only falls back to a full copy
+    if both fail. The result is created under a temporary name and moved over
+    dst, so an existing dst survives if every method fails.
+    """
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        print(f"✓ Already available at standard location: {dst}")
+        return
+
+    tmp = f"{dst}.tmp-{os.getpid()}"
+    if os.path.lexists(tmp):
+        os.remove(tmp)
+    try:
+        try:
+            os.link(src, tmp)
+            method = "Linked"
+        except OSError:
+            try:
+                os.symlink(os.path.realpath(src), tmp)
+                method = "Symlinked"
+            except OSError:
+                shutil.copy2(src, tmp)
+                method = "Copied"
+        # Also replaces a dangling symlink left over from an earlier symlink fallback
+        os.replace(tmp, dst)
+    except BaseException:
+        if os.path.lexists(tmp):
+            os.remove(tmp)
+        raise
+    print(f"✓ {method} to standard location: {dst}")
+
+
+def _upstream_sha256(model_id: str) -> str | None:
+    """Return the Hub's SHA-256 of model.ckpt (the LFS etag), or None if unavailable."""
+    try:
+        etag = get_hf_file_metadata(hf_hub_url(model_id, "model.ckpt")).etag
+    except Exception:
+        return None
+    if etag and re.fullmatch(r"[0-9a-fA-F]{64}", etag):
+        return etag.lower()
+    return None
+
+
+def _write_checksum(model_id: str, path: str, fresh: bool):
+    """
+    Write the expected SHA-256 of path to <path>.sha256 in sha256sum format.
+
+    Prefers the upstream LFS digest, so a corrupted local file fails verification.
+    Without it, the local file is hashed only right after a fresh download and an
+    existing sidecar is never overwritten, so later corruption is not recorded as valid.
+    """
+    sidecar = path + ".sha256"
+    digest = _upstream_sha256(model_id)
+    if digest is None:
+        if not fresh or os.path.exists(sidecar) or ckpt_sha256 is None:
+            print(f"⚠️  Upstream checksum unavailable, not updating {sidecar}")
+            return
+        digest = ckpt_sha256(path)
+    with open(sidecar, "w") as f:
+        f.write(f"{digest}  {os.path.basename(path)}\n")
+    print(f"✓ Wrote checksum: {sidecar}")
+
 
 def setup_offline_weights(
     model_id: str = "NX-AI/TiRex",
@@ -45,7 +128,7 @@ def setup_offline_weights(
     """Download and setup offline weights."""
     
     if cache_dir is None:
-        cache_dir = os.path.expanduser("~/.cache/tirex/weights")
+        cache_dir = DEFAULT_WEIGHTS_PATH
     else:
         cache_dir = os.path.expanduser(cache_dir)
     
@@ -55,21 +138,37 @@ def setup_offline_weights(
     print(f"Downloading {model_id} weights...")
     print(f"Cache directory: {cache_dir}")
     
+    if getattr(hf_constants, "HF_HUB_ENABLE_HF_TRANSFER", False):
+        print("Using hf_transfer for parallel download")
+    else:
+        print("Tip: pip install hf_transfer for faster downloads")
+
+    standard_path = os.path.join(cache_dir, "model.ckpt")
+    # A checkpoint already in place may be skipped by hf_hub_download, so it was not freshly downloaded
+    fresh = not os.path.lexists(standard_path)
+
     try:
-        # Download the model checkpoint
+        # Download the model checkpoint straight to <cache_dir>/model.ckpt.
+        # Older huggingface_hub versions without local_dir use the HF cache layout instead.
+        download_kwargs = {"cache_dir": cache_dir}
+        if "local_dir" in inspect.signature(hf_hub_download).parameters:
+            download_kwargs["local_dir"] = cache_dir
         checkpoint_path = hf_hub_download(
             repo_id=model_id,
             filename="model.ckpt",
-            cache_dir=cache_dir,
+            **download_kwargs,
         )
         print(f"✓ Downloaded successfully to: {checkpoint_path}")
         
-        # Copy to standard location if needed
-        standard_path = os.path.join(cache_dir, "model.ckpt")
-        if checkpoint_path != standard_path:
-            import shutil
-            shutil.copy2(checkpoint_path, standard_path)
-            print(f"✓ Copied to standard location: {standard_path}")
+        # Link to standard location if needed
+        if os.path.abspath(checkpoint_path) != os.path.abspath(standard_path):
+            _link_checkpoint(checkpoint_path, standard_path)
+        
+        # Record a checksum for check_weights.py; the weights are usable even if this fails
+        try:
+            _write_checksum(model_id, standard_path, fresh)
+        except OSError as e:
+            print(f"⚠️  Could not write checksum for {standard_path}: {e}")
         
         # Create .env file if requested
         if create_env_file:
@@ -11,6 +11,7 @@ import torch
 from huggingface_hub import hf_hub_download
 
 from tirex.models.slstm.cell import sLSTMCellTorch
+from tirex.offline import DEFAULT_WEIGHTS_PATH
 
 T = TypeVar("T", bound="PretrainedModel")
 VERSION_DELIMITER = "-"
@@ -20,6 +21,14 @@ def skip_cuda():
     return os.getenv("TIREX_NO_CUDA", "False").lower() in ("true", "1", "t")
 
 
+def fast_io():
+    return os.getenv("TIREX_FAST_IO", "False").lower() in ("true", "1", "t")
+
+
+def mmap_io():
+    return os.getenv("TIREX_MMAP", "False").lower() in ("true", "1", "t")
+
+
 def xlstm_available():
     try:
         from xlstm.blocks.slstm.cell import sLSTMCellConfig, sLSTMCellFuncGenerator
@@ -92,7 +101,7 @@ class PretrainedModel(ABC):
         
         # 3. Check default offline cache directory (~/.cache/tirex/weights)
         if checkpoint_path is None:
-            cache_dir = os.path.expanduser("~/.cache/tirex/weights")
+            cache_dir = DEFAULT_WEIGHTS_PATH
             if os.path.exists(cache_dir):
                 local_ckpt = os.path.join(cache_dir, "model.ckpt")
                 if os.path.exists(local_ckpt):
@@ -118,11 +127,34 @@ class PretrainedModel(ABC):
                 )
 
         # load lightning checkpoint
-        checkpoint = torch.load(checkpoint_path, map_location=device, **ckp_kwargs, weights_only=True)
+        if mmap_io() and fast_io():
+            warnings.warn(
+                "Both TIREX_MMAP and TIREX_FAST_IO are set, using memory-mapped checkpoint loading.",
+                UserWarning,
+                stacklevel=2,
+            )
+        use_mmap = mmap_io()
+        if use_mmap:
+            from tirex.offline import prefetch_ckpt, release_ckpt_cache
+
+            prefetch_ckpt(checkpoint_path)
+            ckp_kwargs = {"mmap": True, **ckp_kwargs}
+            checkpoint = torch.load(checkpoint_path, map_location=device, **ckp_kwargs, weights_only=True)
+        elif fast_io():
+            from tirex.offline import read_ckpt_direct
+
+            with read_ckpt_direct(checkpoint_path) as checkpoint_file:
+                checkpoint = torch.load(checkpoint_file, map_location=device, **ckp_kwargs, weights_only=True)
+        else:
+            checkpoint = torch.load(checkpoint_path, map_location=device, **ckp_kwargs, weights_only=True)
         model: T = cls(backend=backend, **checkpoint["hyper_parameters"])
         model.on_load_checkpoint(checkpoint)
         model.load_state_dict(checkpoint["state_dict"])
         model = model.to(device)
+        if use_mmap:
+            # The weights now live in the model, drop the file-backed storages and their cached pages
+            del checkpoint
+            release_ckpt_cache(checkpoint_path)
 
         if compile and backend == "torch":
             compiled_slstm_forward = torch.compile(sLSTMCellTorch.slstm_forward)
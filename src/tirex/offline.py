@@ -10,13 +10,24 @@ Or:
     setup_offline_env(weights_path="/custom/path/to/weights")
 """
 
+import errno
+import functools
+import hashlib
+import mmap as _mmap
 import os
+import re
 from pathlib import Path
+from typing import BinaryIO
+
+DEFAULT_WEIGHTS_PATH = os.path.expanduser("~/.cache/tirex/weights")
+_DIRECT_IO_CHUNK = 16 * 1024 * 1024  # 16 MiB, a multiple of any filesystem block size
 
 
 def setup_offline_env(
     weights_path: str | None = None,
     create_if_missing: bool = False,
+    fast_io: bool = False,
+    mmap: bool = False,
 ) -> bool:
     """
     Setup environment for offline TiRex weight loading.
@@ -25,9 +36,20 @@ def setup_offline_env(
         weights_path: Path to weights directory or model.ckpt file.
                      Defaults to ~/.cache/tirex/weights/
         create_if_missing: If True, creates directory if it doesn't exist.
+        fast_io: If True, read model.ckpt with O_DIRECT (bypassing the page cache)
+                 when loading. Falls back to a buffered read where unsupported.
+                 The whole file is read into memory before torch.load copies the
+                 tensors out, so peak memory is about twice the checkpoint size.
+        mmap: If True, load model.ckpt with torch.load(mmap=True) so tensor storages
+              map the file without copying, prefetch it into the page cache first
+              and drop it from the page cache once the model is built.
+              Cannot be combined with fast_io.
         
     Returns:
         True if setup successful, False otherwise.
+
+    Raises:
+        ValueError: If both fast_io and mmap are requested.
         
     Examples:
         >>> from tirex.offline import setup_offline_env
@@ -38,9 +60,11 @@ def setup_offline_env(
         >>> # Or use custom path
         >>> setup_offline_env("/path/to/my/weights")
     """
-    
+    if fast_io and mmap:
+        raise ValueError("fast_io and mmap are mutually exclusive, choose one checkpoint loading mode")
+
     if weights_path is None:
-        weights_path = os.path.expanduser("~/.cache/tirex/weights")
+        weights_path = DEFAULT_WEIGHTS_PATH
     else:
         weights_path = os.path.expanduser(weights_path)
     
@@ -56,24 +80,209 @@ def setup_offline_env(
     
     # Set environment variable
     os.environ["TIREX_WEIGHTS_PATH"] = weights_path
+    _is_offline.cache_clear()
     print(f"✓ Offline mode enabled with weights from: {weights_path}")
+
+    # Loading modes follow the arguments, so a later call can switch them off again
+    if fast_io:
+        os.environ["TIREX_FAST_IO"] = "1"
+        print("✓ Direct I/O checkpoint loading enabled")
+    else:
+        os.environ.pop("TIREX_FAST_IO", None)
+
+    if mmap:
+        os.environ["TIREX_MMAP"] = "1"
+        print("✓ Memory-mapped checkpoint loading enabled")
+    else:
+        os.environ.pop("TIREX_MMAP", None)
     
     return True
 
 
-def get_weights_path() -> str | None:
+def get_weights_path() -> str:
     """
     Get the current offline weights path.
     
     Returns:
-        Path to weights directory or None if not configured.
+        Path from TIREX_WEIGHTS_PATH, or the default ~/.cache/tirex/weights/.
     """
-    return os.getenv("TIREX_WEIGHTS_PATH")
+    return os.environ.get("TIREX_WEIGHTS_PATH", DEFAULT_WEIGHTS_PATH)
 
 
 def is_offline_mode() -> bool:
-    """Check if offline mode is enabled."""
-    weights_path = get_weights_path()
-    if weights_path and os.path.exists(weights_path):
-        return True
-    return False
+    """
+    Check if offline mode is enabled.
+
+    The existence check is cached per weights path. Creating or deleting the
+    directory outside of setup_offline_env() is not picked up until
+    setup_offline_env() is called again.
+    """
+    return _is_offline(get_weights_path())
+
+
+@functools.lru_cache(maxsize=8)
+def _is_offline(weights_path: str) -> bool:
+    return bool(weights_path) and os.path.exists(weights_path)
+
+
+def read_ckpt_direct(path: str) -> _mmap.mmap | BinaryIO:
+    """
+    Read a checkpoint file with O_DIRECT into a page-aligned buffer.
+
+    Bypasses the page cache, which avoids double buffering for large cold reads.
+    The whole file is held in the returned buffer, so while torch.load builds
+    the tensors from it peak memory is about twice the file size. Falls back to
+    a regular buffered file on platforms or filesystems without O_DIRECT
+    support. If O_DIRECT is rejected partway through (e.g. after a short,
+    unaligned read), the rest of the file is read buffered from that offset.
+
+    Args:
+        path: Path to the checkpoint file.
+
+    Returns:
+        A file-like object over the contents that can be passed directly to
+        torch.load. Close it (or use it as a context manager) once loading is done.
+    """
+    o_direct = getattr(os, "O_DIRECT", None)
+    if o_direct is None:
+        return open(path, "rb")
+
+    try:
+        fd = os.open(path, os.O_RDONLY | o_direct)
+    except OSError as e:
+        if e.errno in (errno.EINVAL, errno.ENOTSUP, errno.EOPNOTSUPP):
+            return open(path, "rb")
+        raise
+
+    try:
+        size = os.fstat(fd).st_size
+        if size == 0:
+            return open(path, "rb")
+        # Anonymous mappings are page aligned, as O_DIRECT requires
+        aligned_size = -(-size // _mmap.PAGESIZE) * _mmap.PAGESIZE
+        buf = _mmap.mmap(-1, aligned_size)
+        try:
+            offset = _read_direct_into(fd, path, buf, size)
+            # Trim the alignment padding so the buffer ends where the file does
+            buf.resize(offset)
+        except SystemError:
+            # No mremap() to trim the buffer on this platform
+            buf.close()
+            return open(path, "rb")
+        except BaseException:
+            buf.close()
+            raise
+        return buf
+    finally:
+        os.close(fd)
+
+
+def _read_direct_into(fd: int, path: str, buf: _mmap.mmap, size: int) -> int:
+    view = memoryview(buf)
+    try:
+        offset = 0
+        while offset < size:
+            with view[offset : offset + _DIRECT_IO_CHUNK] as chunk:
+                try:
+                    n = os.preadv(fd, [chunk], offset)
+                except OSError as e:
+                    if e.errno not in (errno.EINVAL, errno.ENOTSUP, errno.EOPNOTSUPP):
+                        raise
+                    n = None
+            if n is None:
+                # O_DIRECT rejected mid-file, keep what was read and continue buffered
+                return _read_buffered_into(path, view, offset, size)
+            if n == 0:
+                break
+            offset += n
+        return offset
+    finally:
+        view.release()
+
+
+def _read_buffered_into(path: str, view: memoryview, offset: int, size: int) -> int:
+    with open(path, "rb") as f:
+        f.seek(offset)
+        while offset < size:
+            with view[offset:size] as rest:
+                n = f.readinto(rest)
+            if not n:
+                break
+            offset += n
+    return offset
+
+
+def prefetch_ckpt(path: str):
+    """
+    Start asynchronous read-ahead of a checkpoint file into the page cache.
+
+    Maps the file without prefaulting and advises MADV_WILLNEED, so the kernel
+    reads the file ahead while torch.load(..., mmap=True) maps the storages
+    from the same page cache. No-op where madvise is unavailable.
+
+    Args:
+        path: Path to the checkpoint file.
+    """
+    if not hasattr(_mmap, "MADV_WILLNEED"):
+        return
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with _mmap.mmap(f.fileno(), 0, flags=_mmap.MAP_SHARED, prot=_mmap.PROT_READ) as mm:
+            mm.madvise(_mmap.MADV_WILLNEED)
+
+
+def release_ckpt_cache(path: str):
+    """
+    Ask the kernel to drop a checkpoint's pages from the page cache.
+
+    Call once the loaded checkpoint is no longer referenced; pages still mapped
+    elsewhere are kept. No-op where posix_fadvise is unavailable.
+
+    Args:
+        path: Path to the checkpoint file.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+def ckpt_sha256(path: str) -> str:
+    """
+    Compute the SHA-256 hex digest of a checkpoint file.
+
+    Uses hashlib.file_digest, which streams the file through OpenSSL and its
+    hardware-accelerated SHA-256 where the CPU supports it.
+    """
+    with open(path, "rb", buffering=0) as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def verify_ckpt(path: str, expected_sha256: str | None = None) -> bool:
+    """
+    Verify a checkpoint file against its SHA-256 digest.
+
+    Args:
+        path: Path to the checkpoint file.
+        expected_sha256: Expected hex digest. Defaults to the digest stored in
+                         ``<path>.sha256`` (as written by setup_offline_weights.py).
+
+    Returns:
+        True if the digest matches, False otherwise.
+
+    Raises:
+        FileNotFoundError: If no expected digest is given and no ``.sha256`` file exists.
+        ValueError: If the expected digest is not a 64-character hex string.
+    """
+    if expected_sha256 is None:
+        with open(path + ".sha256") as f:
+            fields = f.read().split()
+        expected_sha256 = fields[0] if fields else ""
+    if not re.fullmatch(r"[0-9a-fA-F]{64}", expected_sha256):
+        raise ValueError(f"Invalid SHA-256 digest for {path}: {expected_sha256!r}")
+
+    return ckpt_sha256(path) == expected_sha256.lower()
@@ -0,0 +1,183 @@
+# Copyright (c) NXAI GmbH.
+# This software may be used and distributed according to the terms of the NXAI Community License Agreement.
+
+import errno
+import hashlib
+import mmap
+import os
+
+import pytest
+import torch
+
+import tirex.offline as offline
+from tirex.offline import (
+    get_weights_path,
+    is_offline_mode,
+    prefetch_ckpt,
+    read_ckpt_direct,
+    release_ckpt_cache,
+    setup_offline_env,
+    verify_ckpt,
+)
+
+
+def _write_random(path, size: int) -> bytes:
+    data = os.urandom(size)
+    path.write_bytes(data)
+    return data
+
+
+def _save_state(path) -> dict:
+    state = {"hyper_parameters": {"input_patch_size": 32}, "state_dict": {"weight": torch.randn(8, 4)}}
+    torch.save(state, path)
+    return state
+
+
+def test_read_ckpt_direct_roundtrip_unaligned_size(tmp_path):
+    path = tmp_path / "model.ckpt"
+    data = _write_random(path, 3 * mmap.PAGESIZE + 123)
+
+    with read_ckpt_direct(str(path)) as f:
+        assert f.read() == data
+
+
+def test_read_ckpt_direct_without_o_direct(tmp_path, monkeypatch):
+    path = tmp_path / "model.ckpt"
+    data = _write_random(path, mmap.PAGESIZE + 1)
+    monkeypatch.delattr(os, "O_DIRECT", raising=False)
+
+    with read_ckpt_direct(str(path)) as f:
+        assert f.read() == data
+
+
+def test_read_ckpt_direct_continues_buffered_after_einval(tmp_path, monkeypatch):
+    path = tmp_path / "model.ckpt"
+    data = _write_random(path, 3 * mmap.PAGESIZE + 123)
+    monkeypatch.setattr(offline, "_DIRECT_IO_CHUNK", mmap.PAGESIZE)
+    preadv = os.preadv
+    calls = []
+
+    def flaky_preadv(fd, buffers, offset):
+        calls.append(offset)
+        if len(calls) > 1:
+            raise OSError(errno.EINVAL, os.strerror(errno.EINVAL))
+        return preadv(fd, buffers, offset)
+
+    monkeypatch.setattr(os, "preadv", flaky_preadv)
+
+    with read_ckpt_direct(str(path)) as f:
+        assert f.read() == data
+
+
+def test_read_ckpt_direct_feeds_torch_load(tmp_path):
+    path = tmp_path / "model.ckpt"
+    state = _save_state(path)
+
+    with read_ckpt_direct(str(path)) as f:
+        loaded = torch.load(f, map_location="cpu", weights_only=True)
+
+    assert loaded["hyper_parameters"] == state["hyper_parameters"]
+    assert torch.equal(loaded["state_dict"]["weight"], state["state_dict"]["weight"])
+
+
+def test_mmap_load_with_prefetch_and_release(tmp_path):
+    path = tmp_path / "model.ckpt"
+    state = _save_state(path)
+
+    prefetch_ckpt(str(path))
+    loaded = torch.load(str(path), map_location="cpu", mmap=True, weights_only=True)
+    weight = loaded["state_dict"]["weight"].clone()
+    del loaded
+    release_ckpt_cache(str(path))
+
+    assert torch.equal(weight, state["state_dict"]["weight"])
+
+
+def test_get_weights_path_env_var(tmp_path, monkeypatch):
+    monkeypatch.setenv("TIREX_WEIGHTS_PATH", str(tmp_path))
+    assert get_weights_path() == str(tmp_path)
+
+
+def test_get_weights_path_default(tmp_path, monkeypatch):
+    monkeypatch.delenv("TIREX_WEIGHTS_PATH", raising=False)
+    monkeypatch.setattr(offline, "DEFAULT_WEIGHTS_PATH", str(tmp_path / "default"))
+    assert get_weights_path() == str(tmp_path / "default")
+
+
+def test_is_offline_mode(tmp_path, monkeypatch):
+    default_path = tmp_path / "default"
+    monkeypatch.setattr(offline, "DEFAULT_WEIGHTS_PATH", str(default_path))
+    monkeypatch.delenv("TIREX_WEIGHTS_PATH", raising=False)
+    offline._is_offline.cache_clear()
+
+    assert not is_offline_mode()
+
+    monkeypatch.setenv("TIREX_WEIGHTS_PATH", str(tmp_path))
+    assert is_offline_mode()
+
+
+def test_setup_offline_env_refreshes_offline_mode(tmp_path, monkeypatch):
+    weights_path = tmp_path / "weights"
+    monkeypatch.setenv("TIREX_WEIGHTS_PATH", str(weights_path))
+    offline._is_offline.cache_clear()
+    assert not is_offline_mode()
+
+    weights_path.mkdir()
+    assert setup_offline_env(str(weights_path))
+    assert is_offline_mode()
+
+
+def test_verify_ckpt_match(tmp_path):
+    path = tmp_path / "model.ckpt"
+    data = _write_random(path, 1024)
+    (tmp_path / "model.ckpt.sha256").write_text(f"{hashlib.sha256(data).hexdigest()}  model.ckpt\n")
+
+    assert verify_ckpt(str(path))
+    assert verify_ckpt(str(path), hashlib.sha256(data).hexdigest().upper())
+
+
+def test_verify_ckpt_mismatch(tmp_path):
+    path = tmp_path / "model.ckpt"
+    _write_random(path, 1024)
+
+    assert not verify_ckpt(str(path), "0" * 64)
+
+
+def test_verify_ckpt_missing_sidecar(tmp_path):
+    path = tmp_path / "model.ckpt"
+    _write_random(path, 1024)
+
+    with pytest.raises(FileNotFoundError):
+        verify_ckpt(str(path))
+
+
+def test_verify_ckpt_invalid_sidecar(tmp_path):
+    path = tmp_path / "model.ckpt"
+    _write_random(path, 1024)
+    (tmp_path / "model.ckpt.sha256").write_text("")
+
+    with pytest.raises(ValueError):
+        verify_ckpt(str(path))
+
+
+def test_setup_offline_env_loading_modes_follow_arguments(tmp_path, monkeypatch):
+    monkeypatch.setenv("TIREX_WEIGHTS_PATH", str(tmp_path))
+    monkeypatch.delenv("TIREX_FAST_IO", raising=False)
+    monkeypatch.delenv("TIREX_MMAP", raising=False)
+
+    assert setup_offline_env(str(tmp_path), fast_io=True)
+    assert os.environ["TIREX_FAST_IO"] == "1"
+    assert "TIREX_MMAP" not in os.environ
+
+    assert setup_offline_env(str(tmp_path), mmap=True)
+    assert "TIREX_FAST_IO" not in os.environ
+    assert os.environ["TIREX_MMAP"] == "1"
+
+    assert setup_offline_env(str(tmp_path))
+    assert "TIREX_FAST_IO" not in os.environ
+    assert "TIREX_MMAP" not in os.environ
+
+
+def test_setup_offline_env_rejects_both_loading_modes(tmp_path):
+    with pytest.raises(ValueError):
+        setup_offline_env(str(tmp_path), fast_io=True, mmap=True)
@@ -0,0 +1,136 @@
+# Copyright (c) NXAI GmbH.
+# This software may be used and distributed according to the terms of the NXAI Community License Agreement.
+
+import errno
+import hashlib
+import os
+from types import SimpleNamespace
+
+import pytest
+
+import setup_offline_weights
+from setup_offline_weights import _link_checkpoint, setup_offline_weights as run_setup
+from tirex.offline import verify_ckpt
+
+
+def _fail_with(err: int):
+    def fail(*args, **kwargs):
+        raise OSError(err, os.strerror(err))
+
+    return fail
+
+
+@pytest.fixture
+def ckpt(tmp_path):
+    src = tmp_path / "blob"
+    src.write_bytes(b"weights")
+    return str(src), str(tmp_path / "model.ckpt")
+
+
+def test_link_checkpoint_already_samefile(ckpt):
+    src, dst = ckpt
+    os.link(src, dst)
+    ino = os.stat(dst).st_ino
+
+    _link_checkpoint(src, dst)
+
+    assert os.stat(dst).st_ino == ino
+
+
+def test_link_checkpoint_replaces_stale_file(ckpt):
+    src, dst = ckpt
+    with open(dst, "wb") as f:
+        f.write(b"stale")
+
+    _link_checkpoint(src, dst)
+
+    assert os.path.samefile(src, dst)
+
+
+def test_link_checkpoint_replaces_dangling_symlink(ckpt, tmp_path):
+    src, dst = ckpt
+    os.symlink(tmp_path / "missing", dst)
+
+    _link_checkpoint(src, dst)
+
+    assert os.path.samefile(src, dst)
+
+
+@pytest.mark.parametrize("err", [errno.EXDEV, errno.EPERM, errno.EMLINK])
+def test_link_checkpoint_falls_back_to_symlink(ckpt, monkeypatch, err):
+    src, dst = ckpt
+    monkeypatch.setattr(os, "link", _fail_with(err))
+
+    _link_checkpoint(src, dst)
+
+    assert os.path.islink(dst)
+    assert os.path.samefile(src, dst)
+
+
+def test_link_checkpoint_falls_back_to_copy(ckpt, monkeypatch):
+    src, dst = ckpt
+    monkeypatch.setattr(os, "link", _fail_with(errno.EPERM))
+    monkeypatch.setattr(os, "symlink", _fail_with(errno.EPERM))
+
+    _link_checkpoint(src, dst)
+
+    assert not os.path.islink(dst)
+    with open(dst, "rb") as f:
+        assert f.read() == b"weights"
+
+
+def test_link_checkpoint_keeps_old_file_on_failure(ckpt, monkeypatch, tmp_path):
+    src, dst = ckpt
+    with open(dst, "wb") as f:
+        f.write(b"old")
+    monkeypatch.setattr(os, "link", _fail_with(errno.EPERM))
+    monkeypatch.setattr(os, "symlink", _fail_with(errno.EPERM))
+    monkeypatch.setattr(setup_offline_weights.shutil, "copy2", _fail_with(errno.ENOSPC))
+
+    with pytest.raises(OSError):
+        _link_checkpoint(src, dst)
+
+    with open(dst, "rb") as f:
+        assert f.read() == b"old"
+    assert sorted(os.listdir(tmp_path)) == ["blob", "model.ckpt"]
+
+
+def _fake_hub(monkeypatch, data: bytes, etag: str | None):
+    def hf_hub_download(repo_id, filename, cache_dir=None, local_dir=None):
+        # Like huggingface_hub, skip the download when the file is already in local_dir
+        path = os.path.join(local_dir, filename)
+        if not os.path.exists(path):
+            with open(path, "wb") as f:
+                f.write(data)
+        return path
+
+    def get_hf_file_metadata(url):
+        if etag is None:
+            raise OSError("offline")
+        return SimpleNamespace(etag=etag)
+
+    monkeypatch.setattr(setup_offline_weights, "hf_hub_download", hf_hub_download)
+    monkeypatch.setattr(setup_offline_weights, "get_hf_file_metadata", get_hf_file_metadata)
+
+
+def _corrupt(path):
+    stat = os.stat(path)
+    with open(path, "r+b") as f:
+        first = f.read(1)
+        f.seek(0)
+        f.write(bytes([first[0] ^ 0xFF]))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+@pytest.mark.parametrize("upstream", [True, False])
+def test_setup_rerun_does_not_bless_corrupted_checkpoint(tmp_path, monkeypatch, upstream):
+    data = os.urandom(4096)
+    _fake_hub(monkeypatch, data, hashlib.sha256(data).hexdigest() if upstream else None)
+    ckpt = str(tmp_path / "model.ckpt")
+
+    assert run_setup(cache_dir=str(tmp_path))
+    assert verify_ckpt(ckpt)
+
+    _corrupt(ckpt)
+    assert run_setup(cache_dir=str(tmp_path))
+    assert not verify_ckpt(ckpt)